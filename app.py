@@ -1,40 +1,63 @@
 import streamlit as st
-import json
+import hashlib
+import orjson
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Render off-screen; must be selected before importing pyplot
 import matplotlib.pyplot as plt
+from PIL import Image
+import plotly.graph_objects as go
 from main import ConvexHull
 from io import BytesIO
-import base64
 
-def get_download_link(fig, filename="convex_hull.png", text="Download Plot"):
+# Example data offered for download, serialized once at import
+EXAMPLE_JSON = orjson.dumps({
+    "points": [
+        [2, 2], [4, 3], [5, 1], [6, 4], [7, 5],
+        [3, 6], [1, 7], [0, 5], [1, 3], [2, 4],
+        [3, 3], [4, 5], [5, 3], [3, 2], [2, 1],
+        [4, 1], [6, 2], [5, 5], [4, 7], [2, 6]
+    ]
+}, option=orjson.OPT_INDENT_2)
+
+# Above this many points the plot is drawn in the browser with WebGL instead of matplotlib
+WEBGL_THRESHOLD = 10_000
+
+def digest(data):
     """
-    Generates a download link for the plot
+    Returns a short content hash of the uploaded bytes, used as the cache key for its results
     """
-    buf = BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
-    buf.seek(0)
-    b64 = base64.b64encode(buf.getvalue()).decode()
-    href = f'<a href="data:image/png;base64,{b64}" download="{filename}">{text}</a>'
-    return href
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@st.cache_data
+def compute_hull(key, _points):
+    """
+    Computes the convex hull of the points, cached across reruns by the upload's digest
+    """
+    return ConvexHull(_points).compute_hull()
 
 def create_plot(points, hull):
     """
-    Creates a matplotlib figure with the points and hull
+    Draws the points and hull on the session's matplotlib figure and returns it
     """
-    # Clear any existing plots
-    plt.clf()
-    
-    # Create new figure and axis
-    fig, ax = plt.subplots(figsize=(10, 10))
+    # Create the figure once per session and only clear its axis afterwards
+    if 'fig' not in st.session_state:
+        st.session_state.fig, st.session_state.ax = plt.subplots(figsize=(10, 10))
+        # Detach from pyplot so the figure lives only as long as the session
+        plt.close(st.session_state.fig)
+    fig, ax = st.session_state.fig, st.session_state.ax
+    ax.clear()
     
-    # Plot points
-    x = [p[0] for p in points]
-    y = [p[1] for p in points]
-    ax.scatter(x, y, color='blue', label='Points')
+    # Plot points; float32 is ample for screen coordinates and halves the data to draw
+    pts_arr = np.asarray(points, dtype=np.float32)
+    ax.scatter(pts_arr[:, 0], pts_arr[:, 1], color='blue', label='Points')
     
     # Plot hull
     if len(hull) > 2:
-        hull_x = [p[0] for p in hull] + [hull[0][0]]
-        hull_y = [p[1] for p in hull] + [hull[0][1]]
+        # Repeat the first point to close the polygon
+        hull_arr = np.asarray(hull, dtype=np.float32)
+        hull_x = np.concatenate([hull_arr[:, 0], hull_arr[:1, 0]])
+        hull_y = np.concatenate([hull_arr[:, 1], hull_arr[:1, 1]])
         ax.plot(hull_x, hull_y, 'r-', linewidth=2, label='Convex Hull')
     
     # Add labels and grid
@@ -45,10 +68,108 @@ def create_plot(points, hull):
     ax.legend()
     
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
     
     return fig
 
+@st.cache_data
+def create_interactive_plot(key, _points, _hull):
+    """
+    Creates a plotly figure with the points and hull, rendered client-side with WebGL
+    """
+    # float32 is ample for screen coordinates and halves the data shipped to the browser
+    pts_arr = np.asarray(_points, dtype=np.float32)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=pts_arr[:, 0], y=pts_arr[:, 1], mode='markers',
+        marker=dict(color='blue', size=3), name='Points'
+    ))
+    
+    # Plot hull
+    if len(_hull) > 2:
+        # Repeat the first point to close the polygon
+        hull_arr = np.asarray(_hull, dtype=np.float32)
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([hull_arr[:, 0], hull_arr[:1, 0]]),
+            y=np.concatenate([hull_arr[:, 1], hull_arr[:1, 1]]),
+            mode='lines', line=dict(color='red', width=2), name='Convex Hull'
+        ))
+    
+    fig.update_layout(title="Convex Hull using Graham Scan", xaxis_title="X", yaxis_title="Y")
+    
+    return fig
+
+@st.cache_data
+def hull_to_json(key, _hull):
+    """
+    Serializes the hull points as indented JSON bytes, cached across reruns
+    """
+    return orjson.dumps({"hull_points": _hull}, option=orjson.OPT_INDENT_2)
+
+@st.cache_data
+def render_png(key, _points, _hull):
+    """
+    Renders the plot of the points and hull to PNG bytes, cached across reruns
+    """
+    fig = create_plot(_points, _hull)
+    
+    # Encode the Agg canvas buffer directly rather than going through savefig
+    fig.canvas.draw()
+    img = Image.frombuffer('RGBA', fig.canvas.get_width_height(physical=True),
+                           fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+    buf = BytesIO()
+    img.save(buf, 'PNG', optimize=False)
+    return buf.getvalue()
+
+@st.fragment
+def show_results(key, raw, points, hull):
+    """
+    Displays the plot and download buttons; reruns independently of the rest of the page
+    
+    The cached helpers are keyed on the upload's digest so the points are never hashed.
+    """
+    # Create and display plot; large inputs skip server-side rasterization
+    if len(points) > WEBGL_THRESHOLD:
+        st.plotly_chart(create_interactive_plot(key, points, hull), use_container_width=True)
+    else:
+        # Show the cached PNG so reruns don't redraw the figure
+        st.image(render_png(key, points, hull), use_container_width=True)
+    
+    # Create columns for download buttons
+    col1, col2, col3 = st.columns(3)
+    
+    # Download plot as PNG; large inputs are only rasterized once the user asks for it
+    with col1:
+        if len(points) > WEBGL_THRESHOLD and st.session_state.get('png_key') != key:
+            st.button("Prepare Plot Download",
+                      on_click=lambda: st.session_state.update(png_key=key))
+        else:
+            st.download_button(
+                label="Download Plot",
+                data=render_png(key, points, hull),
+                file_name="convex_hull.png",
+                mime="image/png"
+            )
+    
+    # Download hull points as JSON
+    with col2:
+        st.download_button(
+            label="Download Hull Points",
+            data=hull_to_json(key, hull),
+            file_name="hull_points.json",
+            mime="application/json"
+        )
+    
+    # Download all points as the original upload; no need to serialize them again
+    with col3:
+        st.download_button(
+            label="Download All Points",
+            data=raw,
+            file_name="all_points.json",
+            mime="application/json"
+        )
+
 def main():
     st.title("Convex Hull Visualization")
     st.write("""
@@ -62,7 +183,8 @@ def main():
     if uploaded_file is not None:
         try:
             # Read the uploaded file
-            data = json.load(uploaded_file)
+            raw = uploaded_file.getvalue()
+            data = orjson.loads(raw)
             
             # Validate the data format
             if "points" not in data:
@@ -71,49 +193,18 @@ def main():
                 
             points = data["points"]
             
-            # Create ConvexHull object and compute hull
-            convex_hull = ConvexHull(points)
-            hull = convex_hull.compute_hull()
+            # Compute the hull; keying the cache on the digest avoids hashing every point
+            key = digest(raw)
+            hull = compute_hull(key, points)
             
             # Display information
             st.write(f"Number of points: {len(points)}")
             st.write(f"Number of hull points: {len(hull)}")
             
-            # Create and display plot
-            fig = create_plot(points, hull)
-            st.pyplot(fig)
-            
-            # Create columns for download buttons
-            col1, col2, col3 = st.columns(3)
-            
-            # Download plot as PNG
-            with col1:
-                st.markdown(get_download_link(fig, text="Download Plot"), unsafe_allow_html=True)
+            # Plot and downloads rerun on their own when a button is clicked
+            show_results(key, raw, points, hull)
             
-            # Download hull points as JSON
-            with col2:
-                hull_json = json.dumps({"hull_points": hull}, indent=4)
-                st.download_button(
-                    label="Download Hull Points",
-                    data=hull_json,
-                    file_name="hull_points.json",
-                    mime="application/json"
-                )
-            
-            # Download all points as JSON
-            with col3:
-                points_json = json.dumps({"points": points}, indent=4)
-                st.download_button(
-                    label="Download All Points",
-                    data=points_json,
-                    file_name="all_points.json",
-                    mime="application/json"
-                )
-            
-            # Clean up the figure to free memory
-            plt.close(fig)
-            
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             st.error("Error: Invalid JSON file format")
         except Exception as e:
             st.error(f"Error: {str(e)}")
@@ -122,18 +213,9 @@ def main():
     st.markdown("---")
     st.write("Try it out with example data:")
     
-    example_data = {
-        "points": [
-            [2, 2], [4, 3], [5, 1], [6, 4], [7, 5],
-            [3, 6], [1, 7], [0, 5], [1, 3], [2, 4],
-            [3, 3], [4, 5], [5, 3], [3, 2], [2, 1],
-            [4, 1], [6, 2], [5, 5], [4, 7], [2, 6]
-        ]
-    }
-    
     st.download_button(
         label="Download Example Data",
-        data=json.dumps(example_data, indent=4),
+        data=EXAMPLE_JSON,
         file_name="example_points.json",
         mime="application/json"
     )
@@ -1,6 +1,60 @@
 import json
 import math
+import numpy as np
 import matplotlib.pyplot as plt
+from numba import njit
+
+# Largest integer coordinate kept in int64: differences stay below 2**31, so the
+# cross product of two differences cannot overflow
+_MAX_INT_COORD = 2**30
+
+# From this many points on, compute_hull delegates to Qhull, which outpaces the scan
+QHULL_THRESHOLD = 100_000
+
+
+@njit(cache=True)
+def _cross(xs, ys, a, b, c):
+    """Cross product (b - a) x (c - a) of the points at indices a, b and c."""
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+
+# Compiled ahead of time for exact integer and for float coordinates
+@njit(["int64[:](int64[::1], int64[::1], int64[::1])",
+       "int64[:](float64[::1], float64[::1], int64[::1])"], cache=True)
+def _andrew(xs, ys, order):
+    """
+    Andrew's monotone chain over point indices pre-sorted by (x, y).
+    
+    Returns the indices of the hull vertices in counterclockwise order.
+    """
+    n = order.size
+    if n < 2:
+        # All points coincide, so the lone candidate is the whole hull
+        return order.copy()
+    
+    hull = np.empty(2 * n, np.int64)
+    k = 0
+    
+    # Lower hull: pop points that would make a clockwise turn or lie on the current edge
+    for i in range(n):
+        idx = order[i]
+        while k >= 2 and _cross(xs, ys, hull[k - 2], hull[k - 1], idx) <= 0:
+            k -= 1
+        hull[k] = idx
+        k += 1
+    
+    # Upper hull: same scan right to left, never popping into the lower hull
+    lower = k + 1
+    for i in range(n - 2, -1, -1):
+        idx = order[i]
+        while k >= lower and _cross(xs, ys, hull[k - 2], hull[k - 1], idx) <= 0:
+            k -= 1
+        hull[k] = idx
+        k += 1
+    
+    # The last point is the starting point again
+    return hull[:k - 1]
+
 
 class ConvexHull:
     """
@@ -19,19 +73,64 @@ class ConvexHull:
         self.points = points or []
         self.hull = []
     
-    def compute_hull(self):
+    def _as_array(self):
+        """
+        Builds the (n, 2) array of the current points used by the hull computation.
+        
+        The array is rebuilt on every call so that reassigning or mutating self.points
+        is always picked up. Integral input is kept as int64 so that orientation tests
+        are exact; coordinates are bounded so the cross products cannot overflow.
+        Anything else uses float64.
+        
+        Returns:
+            Array of the points with shape (n, 2)
+        """
+        # Convert once and let NumPy infer the type instead of checking each coordinate
+        pts = np.asarray(self.points)
+        if pts.ndim != 2 or pts.shape[1] != 2:
+            raise ValueError("Points must be given as (x, y) pairs.")
+        if pts.dtype.kind in 'iu' and np.abs(pts).max() <= _MAX_INT_COORD:
+            return pts.astype(np.int64, copy=False)
+        return pts.astype(np.float64, copy=False)
+    
+    def compute_hull(self, use_qhull=True):
         """
         Computes the convex hull using Graham's scan algorithm.
         
+        Args:
+            use_qhull: Whether to delegate large inputs (at least QHULL_THRESHOLD points)
+                to SciPy's Qhull. If False, Graham's scan is always used.
+        
         Returns:
             A list of points forming the convex hull in counterclockwise order.
         """
         if not self.points:
             raise ValueError("No points available. Add points first.")
-            
-        self.hull = self.graham_scan()
+        
+        if use_qhull and len(self.points) >= QHULL_THRESHOLD:
+            self.hull = self._qhull()
+        else:
+            self.hull = self.graham_scan()
         return self.hull
     
+    def _qhull(self):
+        """
+        Computes the convex hull with SciPy's Qhull bindings.
+        
+        Returns:
+            List of points forming the convex hull in counterclockwise order
+        """
+        from scipy.spatial import ConvexHull as Qhull, QhullError
+        
+        try:
+            vertices = Qhull(self._as_array()).vertices
+        except QhullError:
+            # Qhull rejects degenerate input such as all points being collinear
+            return self.graham_scan()
+        
+        # Qhull lists 2-D hull vertices in counterclockwise order
+        return [self.points[i] for i in vertices.tolist()]
+    
     def orientation(self, p, q, r):
         """
         Determines the orientation of triplet (p, q, r).
@@ -44,8 +143,9 @@ class ConvexHull:
             1: If orientation is clockwise
             2: If orientation is counterclockwise
         
-        This is a key function for the Graham scan algorithm. It uses the cross product
-        to determine which way three points turn.
+        It uses the cross product to determine which way three points turn. The hull
+        scan applies the same test in compiled form, treating collinear triplets like
+        clockwise ones so that points on hull edges are dropped without a separate pass.
         """
         # Calculate the cross product (q - p) × (r - q)
         val = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
@@ -54,6 +154,25 @@ class ConvexHull:
             return 0  # Collinear
         return 1 if val > 0 else 2  # Clockwise or Counterclockwise
     
+    def orientations_batch(self, p, q, R):
+        """
+        Determines the orientation of the triplets (p, q, r) for every point r in R at once.
+        
+        Args:
+            p, q: Points as (x, y) tuples or arrays
+            R: Array of points with shape (n, 2)
+            
+        Returns:
+            int8 array with one entry per point in R:
+            0: If points are collinear
+            1: If orientation is clockwise
+            -1: If orientation is counterclockwise
+        """
+        # Same cross product as orientation(), evaluated over all of R in one pass
+        dx1 = q[0] - p[0]
+        dy1 = q[1] - p[1]
+        return np.sign((R[:, 0] - q[0]) * dy1 - (R[:, 1] - q[1]) * dx1).astype(np.int8)
+    
     def distance(self, p1, p2):
         """
         Calculates the Euclidean distance between two points.
@@ -66,14 +185,43 @@ class ConvexHull:
         """
         return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
     
+    def _prune_interior(self, pts):
+        """
+        Finds the points that lie outside the quadrilateral spanned by the extreme points.
+        
+        The leftmost, lowest, rightmost and highest points are always on the hull and
+        form a counterclockwise quadrilateral; any point strictly inside it cannot be
+        a hull vertex. For uniformly distributed points this removes most of the input.
+        
+        Args:
+            pts: Array of points with shape (n, 2)
+            
+        Returns:
+            Array of indices of the remaining candidate points, including the extremes
+        """
+        xs, ys = pts[:, 0], pts[:, 1]
+        extremes = np.array([xs.argmin(), ys.argmin(), xs.argmax(), ys.argmax()])
+        outside = np.zeros(len(pts), dtype=bool)
+        
+        # A point is outside the quadrilateral if it makes a clockwise turn with any edge
+        for a, b in zip(extremes, np.roll(extremes, -1)):
+            outside |= self.orientations_batch(pts[a], pts[b], pts) == 1
+        outside[extremes] = True
+        
+        return np.flatnonzero(outside)
+    
     def graham_scan(self):
         """
-        Implements Graham's scan algorithm to find the convex hull of a set of points.
+        Implements Andrew's monotone chain variant of Graham's scan to find the convex hull.
         
-        The algorithm works in three main steps:
-        1. Find the lowest point (anchor point)
-        2. Sort the remaining points by polar angle with respect to the anchor
-        3. Scan through the sorted points, maintaining a convex hull
+        The algorithm works in three main steps, after discarding points that lie
+        inside the quadrilateral formed by the extreme points:
+        1. Sort the points lexicographically by (x, y)
+        2. Scan left to right, maintaining the lower hull
+        3. Scan right to left, maintaining the upper hull
+        
+        Sorting by coordinates instead of by polar angle avoids trigonometric calls, and
+        popping on collinear triplets discards points lying on hull edges.
         
         Returns:
             List of points forming the convex hull in counterclockwise order
@@ -87,50 +235,20 @@ class ConvexHull:
         if len(points) < 3:
             return points.copy()  # No convex hull possible with less than 3 points
         
-        # Step 1: Find the point with the lowest y-coordinate (and leftmost if tied)
-        # This point is guaranteed to be on the convex hull
-        lowest = min(points, key=lambda p: (p[1], p[0]))
-        
-        # Step 2: Sort the points based on polar angle with respect to the lowest point
-        def polar_angle(p):
-            if p == lowest:
-                return -math.inf  # Place lowest point at the beginning
-            return math.atan2(p[1] - lowest[1], p[0] - lowest[0])
-        
-        sorted_points = sorted(points, key=polar_angle)
-        
-        # Handle collinear points by removing all but the farthest one
-        # This ensures that the hull doesn't zigzag through collinear points
-        i = 1
-        while i < len(sorted_points) - 1:
-            # Check if points i and i+1 make the same angle with the lowest point
-            o = self.orientation(lowest, sorted_points[i], sorted_points[i+1])
-            if o == 0:  # Collinear
-                # Keep the farthest point and remove the closer one
-                if self.distance(lowest, sorted_points[i]) < self.distance(lowest, sorted_points[i+1]):
-                    sorted_points.pop(i)
-                else:
-                    sorted_points.pop(i+1)
-            else:
-                i += 1
-        
-        # Handle edge case: after removing collinear points, we might have fewer than 3 points
-        if len(sorted_points) < 3:
-            return sorted_points
-        
-        # Step 3: Graham scan - Initialize the hull with the first two points
-        hull = [sorted_points[0], sorted_points[1]]
-        
-        # Process remaining points
-        for i in range(2, len(sorted_points)):
-            # For each new point, pop points from hull that would make a non-left turn
-            # This ensures the hull remains convex
-            while len(hull) > 1 and self.orientation(hull[-2], hull[-1], sorted_points[i]) != 2:
-                hull.pop()
-            # Add the new point to the hull
-            hull.append(sorted_points[i])
-        
-        return hull
+        pts = self._as_array()
+        xs = np.ascontiguousarray(pts[:, 0])
+        ys = np.ascontiguousarray(pts[:, 1])
+        
+        # Discard points that cannot be on the hull before sorting
+        candidates = self._prune_interior(pts)
+        
+        # Step 1: Sort the point indices by x-coordinate (and y-coordinate if tied)
+        order = candidates[np.lexsort((ys[candidates], xs[candidates]))]
+        
+        # Steps 2 and 3: Build the lower and upper hulls in compiled code
+        hull = _andrew(xs, ys, order)
+        
+        return [points[i] for i in hull.tolist()]
     
     def add_points(self, new_points):
         """